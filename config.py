@@ -3,10 +3,14 @@ from pathlib import Path
 
 # Cache location
 CACHE_DIR = Path.home() / ".youtube-playlist-cache"
-SEARCHES_FILE = CACHE_DIR / "searches.json"
+SEARCHES_FILE = CACHE_DIR / "searches.jsonl"
+LEGACY_SEARCHES_FILE = CACHE_DIR / "searches.json"  # pre-JSONL cache, imported once
+INDEX_FILE = CACHE_DIR / "searches.idx"
 CREDENTIALS_DIR = CACHE_DIR / "credentials"
 TOKEN_FILE = CREDENTIALS_DIR / "token.json"
 LOGS_DIR = CACHE_DIR / "logs"
+PLAYLISTS_DIR = CACHE_DIR / "playlists"
+PLAYLIST_SNAPSHOT_TTL = 3600  # seconds a playlist snapshot stays fresh
 IN_PROGRESS_DIR = CACHE_DIR / ".in_progress"
 
 # YouTube API
@@ -14,10 +18,12 @@ YOUTUBE_API_SERVICE_NAME = "youtube"
 YOUTUBE_API_VERSION = "v3"
 YOUTUBE_SCOPES = ["https://www.googleapis.com/auth/youtube.force-ssl"]
 MUSIC_CATEGORY_ID = "10"
+BATCH_INSERT_SIZE = 50  # max calls per BatchHttpRequest
 
 # Rate limiting
 RATE_LIMIT_DELAY = 0.5  # seconds between API requests
 MAX_SEARCH_RESULTS = 3  # top N matches to cache
+MAX_CONCURRENT_SEARCHES = 8  # in-flight searches during `search`
 
 # Retry settings
 MAX_RETRIES = 3
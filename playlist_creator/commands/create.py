@@ -57,18 +57,18 @@ def create_command(
         tracks_missing = []
         tracks_not_found = []
 
+        no_entry = (None, None)
+        cached = cache.snapshot([t.query for t in playlist.tracks])
         for track in playlist.tracks:
-            entry = cache.get(track.query)
+            entry, video_id = cached.get(track.query, no_entry)
             if entry is None:
                 tracks_missing.append(track)
             elif entry.status == CacheStatus.NOT_FOUND:
                 tracks_not_found.append(track)
+            elif video_id:
+                tracks_ready.append((track, video_id, entry))
             else:
-                video_id = cache.get_selected_video_id(track.query)
-                if video_id:
-                    tracks_ready.append((track, video_id, entry))
-                else:
-                    tracks_missing.append(track)
+                tracks_missing.append(track)
 
         # Report status
         click.echo()
@@ -125,26 +125,38 @@ def create_command(
         )
         click.echo(f"{Icons.SUCCESS} Playlist criada: https://youtube.com/playlist?list={playlist_id}")
 
-        # Add videos
+        # Add videos in batched HTTP requests
         click.echo()
         added = 0
         failed = 0
+        quota_error = None
+
+        video_ids = [video_id for _, video_id, _ in tracks_ready]
+        results = youtube.add_videos_to_playlist(playlist_id, video_ids)
+
+        for i, ((track, video_id, entry), result) in enumerate(zip(tracks_ready, results), 1):
+            if result is None:
+                continue  # insert never ran (quota exhausted earlier)
 
-        for i, (track, video_id, entry) in enumerate(tracks_ready, 1):
             click.echo(f"[{i}/{len(tracks_ready)}] {track.title} - {track.artist}")
 
-            try:
-                youtube.add_video_to_playlist(playlist_id, video_id)
+            if result is True:
                 click.echo(f"       {Icons.SUCCESS} Adicionado")
                 added += 1
-            except VideoUnavailableError:
+            elif isinstance(result, QuotaExceededError):
+                quota_error = result
+            elif isinstance(result, VideoUnavailableError):
                 click.echo(f"       {Icons.WARNING} Video indisponivel - pulando")
                 failed += 1
-            except QuotaExceededError as e:
-                click.echo(f"\n{Icons.ERROR} {e}")
-                click.echo(f"   Playlist criada: https://youtube.com/playlist?list={playlist_id}")
-                click.echo(f"   {added} musicas adicionadas antes do erro.")
-                raise SystemExit(1)
+            else:
+                click.echo(f"       {Icons.WARNING} {result}")
+                failed += 1
+
+        if quota_error is not None:
+            click.echo(f"\n{Icons.ERROR} {quota_error}")
+            click.echo(f"   Playlist criada: https://youtube.com/playlist?list={playlist_id}")
+            click.echo(f"   {added} musicas adicionadas antes do erro.")
+            raise SystemExit(1)
 
         # Summary
         click.echo()
@@ -1,17 +1,144 @@
 """Search command implementation."""
+import asyncio
 import logging
+import time
 from pathlib import Path
+from typing import Callable, Iterator
 
 import click
 
-from playlist_creator.core.auth import get_authenticated_service
+from config import MAX_CONCURRENT_SEARCHES, RATE_LIMIT_DELAY
+from playlist_creator.core.auth import get_authenticated_service, new_authorized_http
 from playlist_creator.core.cache import CacheManager
-from playlist_creator.core.exceptions import QuotaExceededError, PlaylistCreatorError
+from playlist_creator.core.exceptions import ParseError, QuotaExceededError, PlaylistCreatorError
 from playlist_creator.core.logger import setup_logging
-from playlist_creator.core.parser import parse_markdown
-from playlist_creator.core.utils import Icons, format_track_status
+from playlist_creator.core.parser import parse_markdown_stream
+from playlist_creator.core.utils import Icons
 from playlist_creator.core.youtube_client import YouTubeClient
-from playlist_creator.models import CacheStatus
+from playlist_creator.models import CacheStatus, Track
+
+
+async def _search_stream(
+    client_factory: Callable[[], YouTubeClient],
+    cache: CacheManager,
+    tracks: Iterator[Track],
+    cached_queries,
+    verbose: bool,
+) -> tuple[int, int, int, int]:
+    """Search tracks as they stream out of the parser.
+
+    A producer feeds uncached tracks into a bounded queue consumed by
+    MAX_CONCURRENT_SEARCHES workers, so the first search dispatches
+    before the file is fully parsed. Dispatches are spaced at least
+    RATE_LIMIT_DELAY apart; results print and enter the cache from the
+    event loop (single writer), so CacheManager needs no locking.
+
+    client_factory runs only when the first uncached track dispatches,
+    so a fully cached file never builds the service or touches OAuth.
+
+    Durations are back-filled in one batched lookup after the stream
+    drains (50 videos per API call) instead of one videos.list round-trip
+    per track, so the per-track output omits them.
+
+    Returns:
+        A (found, not_found, skipped, total) tuple of counts.
+    """
+    queue: asyncio.Queue = asyncio.Queue(maxsize=MAX_CONCURRENT_SEARCHES * 2)
+    dispatch_lock = asyncio.Lock()
+    client_lock = asyncio.Lock()
+    client: YouTubeClient | None = None
+    last_dispatch: float | None = None
+    new_entries: list = []
+    found = 0
+    not_found = 0
+    skipped = 0
+    total = 0
+
+    async def get_client() -> YouTubeClient:
+        nonlocal client
+        async with client_lock:
+            if client is None:
+                # May run an interactive OAuth flow; keep it off the loop
+                client = await asyncio.to_thread(client_factory)
+        return client
+
+    async def producer() -> None:
+        nonlocal skipped, total
+        dispatched: set[str] = set()
+        for track in tracks:
+            total += 1
+            if track.query in cached_queries:
+                skipped += 1
+                if verbose:
+                    click.echo(f"[{total}] {track.title} - {track.artist}")
+                    click.echo(f"       {Icons.SKIP} Ja no cache")
+                continue
+            # A query repeated in the file only costs one API call
+            if track.query in dispatched:
+                skipped += 1
+                if verbose:
+                    click.echo(f"[{total}] {track.title} - {track.artist}")
+                    click.echo(f"       {Icons.SKIP} Duplicada no arquivo")
+                continue
+            dispatched.add(track.query)
+            await queue.put((total, track))
+        for _ in range(MAX_CONCURRENT_SEARCHES):
+            await queue.put(None)
+
+    async def worker() -> None:
+        nonlocal last_dispatch, found, not_found
+        while True:
+            item = await queue.get()
+            if item is None:
+                break
+            index, track = item
+
+            youtube = await get_client()
+
+            async with dispatch_lock:
+                if last_dispatch is not None:
+                    wait = RATE_LIMIT_DELAY - (time.monotonic() - last_dispatch)
+                    if wait > 0:
+                        await asyncio.sleep(wait)
+                last_dispatch = time.monotonic()
+
+            result = await asyncio.to_thread(
+                youtube.search_without_durations, track.title, track.artist
+            )
+            cache.set(result)
+            new_entries.append(result)
+
+            click.echo(f"[{index}] {track.title} - {track.artist}")
+
+            if result.status == CacheStatus.FOUND:
+                found += 1
+                match = result.matches[0]
+                click.echo(f"       {Icons.SUCCESS} Encontrado: \"{match.title}\" [{match.channel}]")
+
+                if verbose and len(result.matches) > 1:
+                    for j, alt in enumerate(result.matches[1:], 2):
+                        click.echo(f"         Alt {j}: \"{alt.title}\" [{alt.channel}]")
+            else:
+                not_found += 1
+                click.echo(f"       {Icons.WARNING} Nao encontrado")
+
+            click.echo()
+
+    tasks = [asyncio.create_task(producer())]
+    tasks += [asyncio.create_task(worker()) for _ in range(MAX_CONCURRENT_SEARCHES)]
+
+    try:
+        await asyncio.gather(*tasks)
+    finally:
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+    # One batched duration lookup for everything found in this run
+    if new_entries:
+        await asyncio.to_thread(client.fill_durations, new_entries)
+
+    return found, not_found, skipped, total
 
 
 @click.command("search")
@@ -23,72 +150,43 @@ def search_command(file: Path, force: bool, verbose: bool) -> None:
     logger = setup_logging(verbose=verbose)
 
     try:
-        # Parse markdown
+        # Stream the markdown so searches start before parsing finishes
         click.echo(f"{Icons.FOLDER} Lendo: {file}")
-        playlist = parse_markdown(file)
-        click.echo(f"{Icons.PLAYLIST} Playlist: \"{playlist.name}\"")
+        name, tracks = parse_markdown_stream(file)
+        click.echo(f"{Icons.PLAYLIST} Playlist: \"{name}\"")
+        click.echo()
 
-        # Initialize cache
+        # Initialize cache; resolve membership once instead of per-track has() calls
         cache = CacheManager()
         cache.ensure_initialized()
-
-        # Count cached vs new
-        cached_count = sum(1 for t in playlist.tracks if cache.has(t.query) and not force)
-        new_count = len(playlist.tracks) - cached_count
-
-        click.echo(f"{Icons.SEARCH} {len(playlist.tracks)} musicas no arquivo, {cached_count} ja no cache")
-        click.echo()
-
-        if new_count == 0 and not force:
+        cached_queries = cache.keys() if not force else frozenset()
+
+        # The stream authenticates lazily via this factory; the workers
+        # run in threads, so each gets its own transport (the one inside
+        # the service is not thread-safe)
+        def make_client() -> YouTubeClient:
+            return YouTubeClient(get_authenticated_service(), http_factory=new_authorized_http)
+
+        # Search concurrently; entries are flushed once at the end
+        # (or on quota exhaustion), instead of rewriting the cache per track
+        try:
+            found, not_found, skipped, total = asyncio.run(_search_stream(
+                make_client, cache, tracks, cached_queries, verbose
+            ))
+        except QuotaExceededError as e:
+            click.echo(f"\n{Icons.ERROR} {e}")
+            click.echo(f"   Progresso salvo. Retome mais tarde.")
+            raise SystemExit(1)
+        finally:
+            cache.flush()
+
+        if total == 0:
+            raise ParseError("No valid tracks found in table")
+
+        if found == 0 and not_found == 0:
             click.echo(f"{Icons.SUCCESS} Todas as musicas ja estao no cache. Use --force para re-buscar.")
             return
 
-        # Get authenticated service
-        service = get_authenticated_service()
-        youtube = YouTubeClient(service)
-
-        # Search each track
-        found = 0
-        not_found = 0
-        skipped = 0
-
-        for i, track in enumerate(playlist.tracks, 1):
-            if cache.has(track.query) and not force:
-                if verbose:
-                    click.echo(format_track_status(
-                        i, len(playlist.tracks),
-                        track.title, track.artist,
-                        Icons.SKIP, "Ja no cache"
-                    ))
-                skipped += 1
-                continue
-
-            click.echo(f"[{i}/{len(playlist.tracks)}] {track.title} - {track.artist}")
-            click.echo(f"       {Icons.SEARCH} Buscando...")
-
-            try:
-                result = youtube.search(track.title, track.artist)
-                cache.save(result)
-
-                if result.status == CacheStatus.FOUND:
-                    found += 1
-                    match = result.matches[0]
-                    click.echo(f"       {Icons.SUCCESS} Encontrado: \"{match.title}\" ({match.duration}) [{match.channel}]")
-
-                    if verbose and len(result.matches) > 1:
-                        for j, alt in enumerate(result.matches[1:], 2):
-                            click.echo(f"         Alt {j}: \"{alt.title}\" ({alt.duration}) [{alt.channel}]")
-                else:
-                    not_found += 1
-                    click.echo(f"       {Icons.WARNING} Nao encontrado")
-
-            except QuotaExceededError as e:
-                click.echo(f"\n{Icons.ERROR} {e}")
-                click.echo(f"   Progresso salvo. Retome mais tarde.")
-                raise SystemExit(1)
-
-            click.echo()
-
         # Summary
         click.echo("-" * 40)
         click.echo(f"{Icons.SUCCESS} Busca completa")
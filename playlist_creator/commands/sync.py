@@ -7,7 +7,12 @@ from typing import Optional
 import click
 
 from playlist_creator.core.auth import get_authenticated_service
-from playlist_creator.core.cache import CacheManager
+from playlist_creator.core.cache import (
+    CacheManager,
+    delete_playlist_snapshot,
+    load_playlist_snapshot,
+    save_playlist_snapshot,
+)
 from playlist_creator.core.exceptions import (
     QuotaExceededError,
     VideoUnavailableError,
@@ -21,14 +26,16 @@ from playlist_creator.core.youtube_client import YouTubeClient
 from playlist_creator.models import CacheStatus
 
 
+_PLAYLIST_ID_RE = re.compile(r"[?&]list=([^&]+)")
+
+
 def extract_playlist_id(url_or_id: str) -> str:
     """Extract playlist ID from URL or return as-is if already an ID."""
-    # Match playlist ID in URL
-    match = re.search(r"[?&]list=([^&]+)", url_or_id)
-    if match:
-        return match.group(1)
-    # Assume it's already an ID
-    return url_or_id
+    # Bare IDs have no query string
+    if "?" not in url_or_id and "&" not in url_or_id:
+        return url_or_id
+    match = _PLAYLIST_ID_RE.search(url_or_id)
+    return match.group(1) if match else url_or_id
 
 
 @click.command("sync")
@@ -71,16 +78,15 @@ def sync_command(
         missing_cache = []
         not_found = []
 
+        cached = cache.snapshot([t.query for t in playlist.tracks])
         for track in playlist.tracks:
-            video_id = cache.get_selected_video_id(track.query)
+            entry, video_id = cached.get(track.query, (None, None))
             if video_id:
                 desired.append((track.position, track, video_id))
+            elif entry and entry.status == CacheStatus.NOT_FOUND:
+                not_found.append(track)
             else:
-                entry = cache.get(track.query)
-                if entry and entry.status == CacheStatus.NOT_FOUND:
-                    not_found.append(track)
-                else:
-                    missing_cache.append(track)
+                missing_cache.append(track)
 
         if missing_cache:
             click.echo(f"\n{Icons.ERROR} {len(missing_cache)} musicas nao estao no cache.")
@@ -89,44 +95,47 @@ def sync_command(
 
         # Sort by position
         desired.sort(key=lambda x: x[0])
-        desired_video_ids = [vid for _, _, vid in desired]
+        desired_set = {vid for _, _, vid in desired}
 
-        # Get current YouTube state
+        # Get current YouTube state; a dry-run reuses a fresh local
+        # snapshot and skips both authentication and the API call
         click.echo(f"{Icons.SEARCH} Carregando playlist do YouTube...")
 
-        service = get_authenticated_service()
-        youtube = YouTubeClient(service)
+        current_items = load_playlist_snapshot(pl_id) if dry_run else None
 
-        try:
-            current_items = youtube.get_playlist_items(pl_id)
-        except PlaylistNotFoundError:
-            click.echo(f"{Icons.ERROR} Playlist nao encontrada: {pl_id}")
-            raise SystemExit(1)
+        if current_items is not None:
+            click.echo(f"{Icons.CACHED} Usando snapshot local da playlist")
+        else:
+            service = get_authenticated_service()
+            youtube = YouTubeClient(service)
+
+            try:
+                current_items = youtube.get_playlist_items(pl_id)
+            except PlaylistNotFoundError:
+                click.echo(f"{Icons.ERROR} Playlist nao encontrada: {pl_id}")
+                raise SystemExit(1)
+
+            save_playlist_snapshot(pl_id, current_items)
 
         click.echo(f"{Icons.PLAYLIST} YouTube: {len(current_items)} musicas")
 
-        # Build current state map
-        current_by_video_id = {item["video_id"]: item for item in current_items}
-        current_video_ids = [item["video_id"] for item in current_items]
+        # Calculate changes via set differences
+        current_vids = {item["video_id"] for item in current_items}
+        to_add_vids = desired_set - current_vids
+        extraneous = current_vids - desired_set
 
-        # Calculate changes
-        to_add = []  # (position, track, video_id)
+        to_add = [(pos, track, vid) for pos, track, vid in desired if vid in to_add_vids]
+
+        # Extraneous videos are removed or merely reported, per --remove-unknown
         to_remove = []  # (item_id, video_id)
         unknown = []  # In YouTube but not in desired
-
-        # Find what to add
-        for pos, track, vid in desired:
-            if vid not in current_by_video_id:
-                to_add.append((pos, track, vid))
-
-        # Find what to remove or mark as unknown
-        desired_set = set(desired_video_ids)
-        for item in current_items:
-            if item["video_id"] not in desired_set:
-                if remove_unknown:
-                    to_remove.append((item["item_id"], item["video_id"]))
-                else:
-                    unknown.append(item)
+        if remove_unknown:
+            to_remove = [
+                (item["item_id"], item["video_id"])
+                for item in current_items if item["video_id"] in extraneous
+            ]
+        else:
+            unknown = [item for item in current_items if item["video_id"] in extraneous]
 
         # Report
         click.echo()
@@ -162,21 +171,30 @@ def sync_command(
             click.echo("\n[DRY-RUN] Nenhuma alteracao feita.")
             return
 
-        # Execute changes: Add -> Remove
+        # Execute changes: Add -> Remove. The snapshot saved above stops
+        # describing the playlist as soon as we mutate it, so drop it
+        # first (even a partial run must not leave it serving dry-runs)
+        delete_playlist_snapshot(pl_id)
+
         click.echo()
 
-        # Add new videos
+        # Add new videos in batched HTTP requests
         if to_add:
             click.echo(f"{Icons.SEARCH} Adicionando {len(to_add)} musicas...")
-            for pos, track, vid in to_add:
-                try:
-                    youtube.add_video_to_playlist(pl_id, vid)
+            results = youtube.add_videos_to_playlist(pl_id, [vid for _, _, vid in to_add])
+
+            for (pos, track, vid), result in zip(to_add, results):
+                if result is None:
+                    continue  # insert never ran (quota exhausted earlier)
+                if result is True:
                     click.echo(f"  {Icons.SUCCESS} {track.title} - {track.artist}")
-                except VideoUnavailableError:
+                elif isinstance(result, VideoUnavailableError):
                     click.echo(f"  {Icons.WARNING} {track.title} - video indisponivel")
-                except QuotaExceededError as e:
-                    click.echo(f"\n{Icons.ERROR} {e}")
+                elif isinstance(result, QuotaExceededError):
+                    click.echo(f"\n{Icons.ERROR} {result}")
                     raise SystemExit(1)
+                else:
+                    click.echo(f"  {Icons.WARNING} {track.title} - {result}")
 
         # Remove videos
         if to_remove:
@@ -1,6 +1,6 @@
 """Core modules for YouTube Playlist Creator."""
 from .logger import setup_logging
-from .parser import parse_markdown, parse_markdown_string, ParsedPlaylist
+from .parser import parse_markdown, parse_markdown_stream, parse_markdown_string, ParsedPlaylist
 from .utils import (
     Icons,
     build_search_query,
@@ -12,6 +12,7 @@ from .youtube_client import YouTubeClient
 
 __all__ = [
     "parse_markdown",
+    "parse_markdown_stream",
     "parse_markdown_string",
     "ParsedPlaylist",
     "Icons",
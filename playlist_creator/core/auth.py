@@ -1,9 +1,11 @@
 """OAuth 2.0 authentication for YouTube API."""
 import logging
-from functools import wraps
+from functools import lru_cache, wraps
 from pathlib import Path
 from typing import Optional, Callable, TypeVar
 
+import google_auth_httplib2
+import httplib2
 from google.auth.transport.requests import Request
 from google.oauth2.credentials import Credentials
 from google_auth_oauthlib.flow import InstalledAppFlow
@@ -67,10 +69,36 @@ def get_credentials(client_secrets_path: Optional[Path] = None) -> Credentials:
     return creds
 
 
+@lru_cache(maxsize=1)
 def get_authenticated_service(client_secrets_path: Optional[Path] = None):
-    """Get an authenticated YouTube API service."""
+    """Get an authenticated YouTube API service.
+
+    Memoized so repeated calls in one process reuse the credentials and
+    built service. static_discovery uses the discovery document bundled
+    with the client library instead of fetching it over the network.
+    """
+    creds = get_credentials(client_secrets_path)
+    # One keep-alive connection shared by every API call, instead of the
+    # default per-request transport (each costing a TLS handshake)
+    authorized_http = google_auth_httplib2.AuthorizedHttp(creds, http=httplib2.Http())
+    return build(
+        YOUTUBE_API_SERVICE_NAME,
+        YOUTUBE_API_VERSION,
+        http=authorized_http,
+        static_discovery=True,
+    )
+
+
+def new_authorized_http(client_secrets_path: Optional[Path] = None):
+    """Build a fresh AuthorizedHttp transport for one thread's exclusive use.
+
+    httplib2.Http is not thread-safe, so the connection baked into the
+    shared service must only ever be driven from a single thread.
+    Credentials are safe to share; each call here wraps them around a
+    private keep-alive connection for use with execute(http=...).
+    """
     creds = get_credentials(client_secrets_path)
-    return build(YOUTUBE_API_SERVICE_NAME, YOUTUBE_API_VERSION, credentials=creds)
+    return google_auth_httplib2.AuthorizedHttp(creds, http=httplib2.Http())
 
 
 def ensure_authenticated(func: Callable[..., T]) -> Callable[..., T]:
@@ -1,93 +1,250 @@
 """Cache manager for YouTube search results."""
-import json
+import os
+import time
 from datetime import datetime
 from pathlib import Path
 from typing import Optional
 
-from config import CACHE_DIR, SEARCHES_FILE
+import orjson
+
+from config import (
+    CACHE_DIR,
+    INDEX_FILE,
+    LEGACY_SEARCHES_FILE,
+    PLAYLIST_SNAPSHOT_TTL,
+    PLAYLISTS_DIR,
+    SEARCHES_FILE,
+)
 from playlist_creator.core.exceptions import CacheError
 from playlist_creator.models import CacheEntry, CacheStatus, SearchMatch
 
 
 class CacheManager:
-    """Manages the global search results cache."""
+    """Manages the global search results cache.
+
+    Entries live in an append-only JSONL log. A sidecar index maps each
+    query to its (offset, length) span in the log, so startup only reads
+    the index and individual entries are parsed on first lookup instead
+    of loading the whole cache up front.
+    """
 
     def __init__(self):
-        self._cache: dict[str, CacheEntry] = {}
+        self._cache: dict[str, CacheEntry] = {}  # entries parsed so far
+        self._index: dict[str, tuple[int, int]] = {}  # query -> (offset, length)
         self._loaded = False
+        self._pending: list[CacheEntry] = []
+        self._line_count = 0
 
     def ensure_initialized(self) -> None:
-        """Ensure cache directory exists and data is loaded."""
+        """Ensure cache directory exists and the index is loaded."""
         CACHE_DIR.mkdir(parents=True, exist_ok=True)
         if not self._loaded:
-            self._load()
+            self._load_index()
+
+    def _load_index(self) -> None:
+        """Load the query index, rebuilding it from the log if stale."""
+        self._cache = {}
+        self._index = {}
+        self._line_count = 0
 
-    def _load(self) -> None:
-        """Load cache from disk."""
         if not SEARCHES_FILE.exists():
-            self._cache = {}
+            if LEGACY_SEARCHES_FILE.exists():
+                self._import_legacy_cache()
             self._loaded = True
             return
 
-        try:
-            with open(SEARCHES_FILE, "r", encoding="utf-8") as f:
-                data = json.load(f)
+        if INDEX_FILE.exists():
+            try:
+                data = orjson.loads(INDEX_FILE.read_bytes())
+                if data.get("log_size") == SEARCHES_FILE.stat().st_size:
+                    self._index = {q: tuple(span) for q, span in data["entries"].items()}
+                    self._line_count = data.get("line_count", len(self._index))
+                    self._loaded = True
+                    return
+            except (orjson.JSONDecodeError, KeyError, ValueError):
+                pass  # stale or corrupt index; fall through to a full scan
+
+        self._rebuild_index()
+        self._loaded = True
+
+    def _import_legacy_cache(self) -> None:
+        """One-time import of the pre-JSONL searches.json cache.
 
-            self._cache = {}
-            for query, entry_data in data.items():
+        Runs when the log does not exist yet but the legacy file does, so
+        established caches keep their quota-funded results. The legacy
+        file is left untouched; once the log exists it is never read again.
+        """
+        try:
+            data = orjson.loads(LEGACY_SEARCHES_FILE.read_bytes())
+            for query, record in data.items():
                 matches = [
-                    SearchMatch(
-                        video_id=m["video_id"],
-                        title=m["title"],
-                        channel=m["channel"],
-                        duration=m["duration"]
-                    )
-                    for m in entry_data.get("matches", [])
+                    SearchMatch(m["video_id"], m["title"], m["channel"], m["duration"])
+                    for m in record.get("matches", [])
                 ]
-                self._cache[query] = CacheEntry(
+                self._pending.append(CacheEntry(
                     query=query,
-                    status=CacheStatus(entry_data["status"]),
+                    status=CacheStatus(record["status"]),
                     matches=matches,
-                    selected=entry_data.get("selected"),
-                    searched_at=datetime.fromisoformat(entry_data["searched_at"]),
-                    query_used=entry_data["query_used"]
-                )
-            self._loaded = True
-        except (json.JSONDecodeError, KeyError, ValueError) as e:
+                    selected=record.get("selected"),
+                    searched_at=datetime.fromisoformat(record["searched_at"]),
+                    query_used=record["query_used"]
+                ))
+        except (orjson.JSONDecodeError, KeyError, ValueError) as e:
+            raise CacheError(f"Failed to load cache: {e}")
+        if self._pending:
+            self._append_pending()
+
+    def _rebuild_index(self) -> None:
+        """Scan the log once to rebuild the query index.
+
+        Each line is one entry; the last line for a query wins, so
+        re-searches naturally supersede older results.
+        """
+        try:
+            with open(SEARCHES_FILE, "rb") as f:
+                offset = 0
+                for line in f:
+                    length = len(line)
+                    if line.strip():
+                        record = orjson.loads(line)
+                        self._index[record["query"]] = (offset, length)
+                        self._line_count += 1
+                    offset += length
+        except (orjson.JSONDecodeError, KeyError, ValueError) as e:
             raise CacheError(f"Failed to load cache: {e}")
+        self._write_index()
 
-    def _save(self) -> None:
-        """Save cache to disk."""
-        data = {}
-        for query, entry in self._cache.items():
-            data[query] = {
-                "status": entry.status.value,
-                "matches": [
-                    {"video_id": m.video_id, "title": m.title, "channel": m.channel, "duration": m.duration}
-                    for m in entry.matches
-                ],
-                "selected": entry.selected,
-                "searched_at": entry.searched_at.isoformat(),
-                "query_used": entry.query_used
-            }
+    def _write_index(self) -> None:
+        """Persist the query index next to the log atomically."""
+        try:
+            log_size = SEARCHES_FILE.stat().st_size if SEARCHES_FILE.exists() else 0
+            tmp = INDEX_FILE.with_suffix(".idx.tmp")
+            with open(tmp, "wb") as f:
+                f.write(orjson.dumps({
+                    "log_size": log_size,
+                    "line_count": self._line_count,
+                    "entries": self._index,
+                }))
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp, INDEX_FILE)
+        except OSError as e:
+            raise CacheError(f"Failed to save cache: {e}")
 
+    def _load_entry(self, query: str) -> CacheEntry:
+        """Parse a single entry from the log via its index span."""
+        offset, length = self._index[query]
+        try:
+            with open(SEARCHES_FILE, "rb") as f:
+                f.seek(offset)
+                record = orjson.loads(f.read(length))
+            entry = self._entry_from_record(record)
+        except (OSError, orjson.JSONDecodeError, KeyError, ValueError) as e:
+            raise CacheError(f"Failed to load cache: {e}")
+        self._cache[query] = entry
+        return entry
+
+    @staticmethod
+    def _entry_from_record(record: dict) -> CacheEntry:
+        """Build a CacheEntry from a deserialized JSONL record."""
+        matches = [SearchMatch(*m) for m in record.get("matches", [])]
+        return CacheEntry(
+            query=record["query"],
+            status=CacheStatus(record["status"]),
+            matches=matches,
+            selected=record.get("selected"),
+            searched_at=datetime.fromtimestamp(record["searched_at"]),
+            query_used=record["query_used"]
+        )
+
+    @staticmethod
+    def _entry_to_record(entry: CacheEntry) -> dict:
+        """Serialize a CacheEntry to a JSONL record.
+
+        Matches are stored positionally as [video_id, title, channel,
+        duration], skipping per-match key dicts on both write and read.
+        """
+        return {
+            "query": entry.query,
+            "status": entry.status.value,
+            "matches": [
+                [m.video_id, m.title, m.channel, m.duration]
+                for m in entry.matches
+            ],
+            "selected": entry.selected,
+            "searched_at": entry.searched_at.timestamp(),
+            "query_used": entry.query_used
+        }
+
+    def _append_pending(self) -> None:
+        """Append pending entries to the JSONL log and update the index."""
         try:
             CACHE_DIR.mkdir(parents=True, exist_ok=True)
-            with open(SEARCHES_FILE, "w", encoding="utf-8") as f:
-                json.dump(data, f, indent=2, ensure_ascii=False)
+            with open(SEARCHES_FILE, "ab") as f:
+                f.seek(0, 2)
+                offset = f.tell()
+                for entry in self._pending:
+                    data = orjson.dumps(self._entry_to_record(entry)) + b"\n"
+                    f.write(data)
+                    self._index[entry.query] = (offset, len(data))
+                    offset += len(data)
+                f.flush()
+                os.fsync(f.fileno())
         except OSError as e:
             raise CacheError(f"Failed to save cache: {e}")
+        self._line_count += len(self._pending)
+        self._pending = []
+        self._write_index()
+
+    def compact(self) -> None:
+        """Rewrite the log with one line per entry, dropping superseded lines."""
+        if self._pending:
+            self._append_pending()
+        entries = [self.get(query) for query in list(self._index)]
+        self._index = {}
+        try:
+            CACHE_DIR.mkdir(parents=True, exist_ok=True)
+            tmp = SEARCHES_FILE.with_suffix(".jsonl.tmp")
+            with open(tmp, "wb") as f:
+                offset = 0
+                for entry in entries:
+                    data = orjson.dumps(self._entry_to_record(entry)) + b"\n"
+                    f.write(data)
+                    self._index[entry.query] = (offset, len(data))
+                    offset += len(data)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp, SEARCHES_FILE)
+        except OSError as e:
+            raise CacheError(f"Failed to save cache: {e}")
+        self._line_count = len(entries)
+        self._write_index()
 
     def get(self, query: str) -> Optional[CacheEntry]:
-        """Get a cache entry by query string."""
+        """Get a cache entry by query string, parsing it on first access."""
         self.ensure_initialized()
-        return self._cache.get(query)
+        entry = self._cache.get(query)
+        if entry is None and query in self._index:
+            entry = self._load_entry(query)
+        return entry
 
-    def save(self, entry: CacheEntry) -> None:
-        """Save a cache entry."""
+    def set(self, entry: CacheEntry) -> None:
+        """Store a cache entry in memory without writing to disk."""
         self.ensure_initialized()
         self._cache[entry.query] = entry
-        self._save()
+        self._pending.append(entry)
+
+    def flush(self) -> None:
+        """Append pending entries to disk, compacting if the log has grown stale."""
+        if self._pending:
+            self._append_pending()
+        if self._index and self._line_count > 2 * len(self._index):
+            self.compact()
+
+    def save(self, entry: CacheEntry) -> None:
+        """Save a cache entry and persist it immediately."""
+        self.set(entry)
+        self.flush()
 
     def get_selected_video_id(self, query: str) -> Optional[str]:
         """Get the selected video ID for a query."""
@@ -98,12 +255,84 @@ class CacheManager:
             return None
         return entry.matches[entry.selected].video_id
 
+    def snapshot(self, queries=None) -> dict[str, tuple[CacheEntry, Optional[str]]]:
+        """Get a mapping of query -> (entry, selected video ID).
+
+        The selected video ID is None when the entry has no usable match,
+        mirroring get_selected_video_id. Passing the queries of interest
+        keeps disk reads proportional to the playlist rather than the
+        whole cache; queries with no entry are simply absent from the
+        result.
+        """
+        self.ensure_initialized()
+        if queries is None:
+            queries = list(self.keys())
+        snapshot = {}
+        for query in queries:
+            entry = self.get(query)
+            if entry is None:
+                continue
+            video_id = None
+            if (
+                entry.status != CacheStatus.NOT_FOUND
+                and entry.selected is not None
+                and entry.selected < len(entry.matches)
+            ):
+                video_id = entry.matches[entry.selected].video_id
+            snapshot[query] = (entry, video_id)
+        return snapshot
+
     def has(self, query: str) -> bool:
         """Check if a query is in the cache."""
         self.ensure_initialized()
-        return query in self._cache
+        return query in self._cache or query in self._index
+
+    def keys(self):
+        """Get the set of all cached query strings."""
+        self.ensure_initialized()
+        return self._index.keys() | self._cache.keys()
 
     def all_entries(self) -> list[CacheEntry]:
         """Get all cache entries."""
         self.ensure_initialized()
-        return list(self._cache.values())
+        return [self.get(query) for query in list(self.keys())]
+
+
+def save_playlist_snapshot(playlist_id: str, items: list[dict]) -> None:
+    """Persist the last observed YouTube state of a playlist.
+
+    Snapshots are best-effort: a failed write just means the next dry-run
+    hits the API again.
+    """
+    try:
+        PLAYLISTS_DIR.mkdir(parents=True, exist_ok=True)
+        path = PLAYLISTS_DIR / f"{playlist_id}.json"
+        path.write_bytes(orjson.dumps({"fetched_at": time.time(), "items": items}))
+    except OSError:
+        pass
+
+
+def delete_playlist_snapshot(playlist_id: str) -> None:
+    """Drop a playlist snapshot before the playlist is mutated.
+
+    Best-effort like save: at worst the next dry-run pays one API fetch.
+    """
+    try:
+        (PLAYLISTS_DIR / f"{playlist_id}.json").unlink(missing_ok=True)
+    except OSError:
+        pass
+
+
+def load_playlist_snapshot(
+    playlist_id: str,
+    max_age: float = PLAYLIST_SNAPSHOT_TTL,
+) -> Optional[list[dict]]:
+    """Load a recent playlist snapshot, or None if absent or stale."""
+    path = PLAYLISTS_DIR / f"{playlist_id}.json"
+    try:
+        data = orjson.loads(path.read_bytes())
+        if time.time() - data["fetched_at"] <= max_age:
+            return data["items"]
+    except (OSError, orjson.JSONDecodeError, KeyError, ValueError):
+        pass
+    return None
@@ -1,25 +1,57 @@
 """Logging configuration for YouTube Playlist Creator."""
+import atexit
 import logging
+import logging.handlers
+import queue
 import sys
 from datetime import datetime
 from pathlib import Path
+from typing import Optional
 
 from config import LOGS_DIR
 
 
+_listener: Optional[logging.handlers.QueueListener] = None
+
+
+def _stop_listener() -> None:
+    """Stop the background log listener, flushing buffered records."""
+    global _listener
+    if _listener is not None:
+        _listener.stop()
+        _listener = None
+
+
+atexit.register(_stop_listener)
+
+
 def setup_logging(verbose: bool = False) -> logging.Logger:
-    """Configure logging for console and file output."""
+    """Configure logging for console and file output.
+
+    File records are funneled through a QueueHandler/QueueListener pair so
+    disk writes happen on a background thread instead of inside the hot
+    search/create loops.
+    """
     logger = logging.getLogger("playlist_creator")
     logger.handlers.clear()
     logger.setLevel(logging.DEBUG)
 
+    global _listener
+    _stop_listener()
+
     try:
         LOGS_DIR.mkdir(parents=True, exist_ok=True)
         log_file = LOGS_DIR / f"{datetime.now():%Y-%m-%d}.log"
         file_handler = logging.FileHandler(log_file, encoding="utf-8")
         file_handler.setLevel(logging.DEBUG)
         file_handler.setFormatter(logging.Formatter("%(asctime)s | %(levelname)-8s | %(message)s"))
-        logger.addHandler(file_handler)
+
+        log_queue: queue.SimpleQueue = queue.SimpleQueue()
+        _listener = logging.handlers.QueueListener(
+            log_queue, file_handler, respect_handler_level=True
+        )
+        _listener.start()
+        logger.addHandler(logging.handlers.QueueHandler(log_queue))
     except OSError:
         pass
 
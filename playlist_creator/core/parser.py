@@ -1,13 +1,15 @@
 """Markdown parser for playlist files."""
-import re
+import sys
 from dataclasses import dataclass
+from operator import attrgetter
 from pathlib import Path
+from typing import Iterable, Iterator, Optional
 
 from playlist_creator.core.exceptions import ParseError
 from playlist_creator.models import Track
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ParsedPlaylist:
     """Result of parsing a Markdown playlist file."""
     name: str
@@ -17,61 +19,149 @@ class ParsedPlaylist:
 
 def parse_markdown(file_path: Path) -> ParsedPlaylist:
     """Parse a Markdown file into a playlist."""
-    content = file_path.read_text(encoding="utf-8")
+    # One read syscall + C-level decode; splitlines() downstream already
+    # handles \r\n, so the universal-newline text layer adds nothing
+    content = file_path.read_bytes().decode("utf-8")
     return parse_markdown_string(content)
 
 
-def parse_markdown_string(content: str) -> ParsedPlaylist:
-    """Parse Markdown content string into a playlist."""
-    # Extract H1 title
-    title_match = re.search(r"^#\s+(.+)$", content, re.MULTILINE)
-    if not title_match:
+def parse_markdown_stream(file_path: Path) -> tuple[str, Iterator[Track]]:
+    """Parse the playlist title eagerly and stream tracks lazily.
+
+    Reads lines until the H1 title is found, then returns the title and a
+    generator that yields each Track as soon as its table row is read, so
+    callers can start working before the whole file is parsed.
+
+    Raises:
+        ParseError: If no H1 title appears before the first table row.
+    """
+    f = open(file_path, "r", encoding="utf-8")
+
+    name = None
+    for line in f:
+        stripped = line.strip()
+        if stripped.startswith("# "):
+            name = stripped[2:].strip()
+            break
+        if stripped.startswith("|"):
+            break
+
+    if name is None:
+        f.close()
         raise ParseError("No H1 title found. File must start with '# Playlist Name'")
 
-    name = title_match.group(1).strip()
+    def tracks() -> Iterator[Track]:
+        with f:
+            yield from _iter_table_tracks(f)
 
-    # Extract ## description (optional)
-    description = ""
-    desc_match = re.search(r"^##\s+(.+)$", content, re.MULTILINE)
-    if desc_match:
-        description = desc_match.group(1).strip()
+    return name, tracks()
 
-    # Find all tables
-    tracks = []
-    table_pattern = re.compile(
-        r"\|[^|]*#[^|]*\|[^|]*Música[^|]*\|[^|]*Artista[^|]*\|.*?\n"  # Header
-        r"\|[-:\s|]+\n"  # Separator (only dashes, colons, spaces, and pipes)
-        r"((?:\|.*?(?:\n|$))+)",  # Rows (handle end of file without newline)
-        re.IGNORECASE
-    )
 
-    tables = table_pattern.findall(content)
+def _parse_row(stripped: str) -> Optional[Track]:
+    """Parse one table row into a Track, or None if the row is not a track."""
+    # Bounded split: only the three leading cells matter, so any extra
+    # columns stay unsplit in the tail element
+    parts = stripped.split("|", 4)
+    if len(parts) < 4:
+        return None
 
-    if not tables:
-        raise ParseError(
-            "No valid table found. Table must have columns: '#', 'Música', 'Artista'"
-        )
+    title = parts[2].strip()
+    artist = parts[3].strip()
+    if not title or not artist:
+        return None
+    try:
+        # Interning repeated artists shares one string object across tracks
+        return Track(position=int(parts[1]), title=title, artist=sys.intern(artist))
+    except ValueError:
+        return None
+
+
+def _iter_table_tracks(lines: Iterable[str]) -> Iterator[Track]:
+    """Yield tracks from table rows in a line-oriented single pass."""
+    OUTSIDE, HEADER_SEEN, IN_ROWS = 0, 1, 2
+    state = OUTSIDE
 
-    for table_rows in tables:
-        for row in table_rows.strip().split("\n"):
-            if not row.strip():
-                continue
+    for line in lines:
+        stripped = line.strip()
+        if not stripped.startswith("|"):
+            state = OUTSIDE
+            continue
 
-            cells = [cell.strip() for cell in row.split("|")]
-            cells = [c for c in cells if c]
+        if state == OUTSIDE:
+            lowered = stripped.lower()
+            if "#" in stripped and "música" in lowered and "artista" in lowered:
+                state = HEADER_SEEN
+            continue
 
-            if len(cells) >= 3:
-                try:
-                    position = int(cells[0])
-                    title = cells[1].strip()
-                    artist = cells[2].strip()
-                    tracks.append(Track(position=position, title=title, artist=artist))
-                except (ValueError, IndexError):
-                    continue
+        if state == HEADER_SEEN:
+            # Separator row: only dashes, colons, spaces, and pipes
+            state = IN_ROWS if all(c in "-:| " for c in stripped) else OUTSIDE
+            continue
+
+        track = _parse_row(stripped)
+        if track is not None:
+            yield track
+
+
+def parse_markdown_string(content: str) -> ParsedPlaylist:
+    """Parse Markdown content string into a playlist.
+
+    Title, description, tables, and rows are all recognized in one pass
+    over the lines with the same small state machine the streaming parser
+    uses, instead of re-scanning the document per regex.
+    """
+    OUTSIDE, HEADER_SEEN, IN_ROWS = 0, 1, 2
+    state = OUTSIDE
+    name = None
+    description = ""
+    saw_table = False
+    tracks = []
+    in_order = True
+
+    for line in content.splitlines():
+        stripped = line.strip()
+
+        if not stripped.startswith("|"):
+            state = OUTSIDE
+            if name is None and stripped.startswith("# "):
+                name = stripped[2:].strip()
+            elif not description and stripped.startswith("## "):
+                description = stripped[3:].strip()
+            continue
+
+        if state == OUTSIDE:
+            lowered = stripped.lower()
+            if "#" in stripped and "música" in lowered and "artista" in lowered:
+                state = HEADER_SEEN
+            continue
+
+        if state == HEADER_SEEN:
+            if all(c in "-:| " for c in stripped):
+                state = IN_ROWS
+                saw_table = True
+            else:
+                state = OUTSIDE
+            continue
+
+        track = _parse_row(stripped)
+        if track is not None:
+            if tracks and track.position < tracks[-1].position:
+                in_order = False
+            tracks.append(track)
+
+    if name is None:
+        raise ParseError("No H1 title found. File must start with '# Playlist Name'")
+
+    if not saw_table:
+        raise ParseError(
+            "No valid table found. Table must have columns: '#', 'Música', 'Artista'"
+        )
 
     if not tracks:
         raise ParseError("No valid tracks found in table")
 
-    tracks.sort(key=lambda t: t.position)
+    # Playlists are normally written in order; sort only when violated
+    if not in_order:
+        tracks.sort(key=attrgetter("position"))
 
     return ParsedPlaylist(name=name, tracks=tracks, description=description)
@@ -1,19 +1,23 @@
 """YouTube API client for search and playlist operations."""
-import json
 import logging
+import threading
 import time
 from datetime import datetime
 from typing import Optional
 
+import orjson
 from googleapiclient.errors import HttpError
 
 from config import (
+    BATCH_INSERT_SIZE,
+    MAX_RETRIES,
     RATE_LIMIT_DELAY,
     MAX_SEARCH_RESULTS,
     MUSIC_CATEGORY_ID,
     DEFAULT_PRIVACY,
 )
 from playlist_creator.core.exceptions import (
+    PlaylistCreatorError,
     QuotaExceededError,
     YouTubeAPIError,
     VideoUnavailableError,
@@ -28,22 +32,51 @@ logger = logging.getLogger("playlist_creator")
 class YouTubeClient:
     """Client for YouTube Data API v3 operations."""
 
-    def __init__(self, service):
+    def __init__(self, service, http_factory=None):
         """Initialize the YouTube client.
 
         Args:
             service: An authenticated YouTube API service instance.
+            http_factory: Optional zero-argument callable returning an
+                authorized HTTP transport. Required when client methods
+                are called from multiple threads: the transport inside
+                service is not thread-safe, so each thread then executes
+                requests over its own transport from this factory.
         """
         self.service = service
-        self._last_request_time: Optional[float] = None
+        self._next_allowed: float = 0.0
+        self._limit_lock = threading.Lock()
+        self._http_factory = http_factory
+        self._thread_http = threading.local()
+
+    def _local_http(self):
+        """Return this thread's private transport, or None to use the default.
+
+        Built lazily from http_factory on the thread's first request and
+        reused for its keep-alive connection afterwards.
+        """
+        if self._http_factory is None:
+            return None
+        http = getattr(self._thread_http, "http", None)
+        if http is None:
+            http = self._http_factory()
+            self._thread_http.http = http
+        return http
 
     def _rate_limit(self) -> None:
-        """Enforce rate limiting between API requests."""
-        if self._last_request_time is not None:
-            elapsed = time.time() - self._last_request_time
-            if elapsed < RATE_LIMIT_DELAY:
-                time.sleep(RATE_LIMIT_DELAY - elapsed)
-        self._last_request_time = time.time()
+        """Enforce rate limiting between API requests.
+
+        Tracks the next allowed dispatch as a monotonic deadline, so the
+        limiter is immune to wall-clock jumps and costs one clock read
+        when no wait is needed. The lock makes concurrent callers (the
+        search workers run in threads) queue for dispatch slots instead
+        of racing on the deadline.
+        """
+        with self._limit_lock:
+            delay = self._next_allowed - time.monotonic()
+            if delay > 0:
+                time.sleep(delay)
+            self._next_allowed = time.monotonic() + RATE_LIMIT_DELAY
 
     def _handle_http_error(self, error: HttpError, video_id: Optional[str] = None) -> None:
         """Handle HTTP errors from the YouTube API.
@@ -58,10 +91,11 @@ class YouTubeClient:
             YouTubeAPIError: For other API errors.
         """
         try:
-            error_content = json.loads(error.content.decode("utf-8"))
+            # orjson takes the raw bytes; no intermediate decode
+            error_content = orjson.loads(error.content)
             errors = error_content.get("error", {}).get("errors", [])
             reason = errors[0].get("reason", "") if errors else ""
-        except (json.JSONDecodeError, KeyError, IndexError):
+        except (orjson.JSONDecodeError, KeyError, IndexError):
             reason = ""
 
         if error.resp.status == 403 and reason in ("quotaExceeded", "dailyLimitExceeded"):
@@ -80,13 +114,37 @@ class YouTubeClient:
             artist: The artist name.
 
         Returns:
-            A CacheEntry with search results.
+            A CacheEntry with search results, durations included.
+
+        Raises:
+            QuotaExceededError: If the API quota has been exceeded.
+            YouTubeAPIError: For other API errors.
+        """
+        entry = self.search_without_durations(title, artist)
+        self.fill_durations([entry])
+        return entry
+
+    def search_without_durations(self, title: str, artist: str) -> CacheEntry:
+        """Search YouTube for a song, leaving match durations empty.
+
+        Callers searching many tracks should collect the entries and make
+        one fill_durations call at the end: videos.list accepts up to 50
+        IDs per request, so deferring the lookup replaces one extra
+        round-trip per track with one per 50 videos.
+
+        Args:
+            title: The song title.
+            artist: The artist name.
+
+        Returns:
+            A CacheEntry with search results and empty duration fields.
 
         Raises:
             QuotaExceededError: If the API quota has been exceeded.
             YouTubeAPIError: For other API errors.
         """
         query = build_search_query(title, artist)
+        searched_at = datetime.now()
         self._rate_limit()
 
         try:
@@ -96,7 +154,7 @@ class YouTubeClient:
                 type="video",
                 videoCategoryId=MUSIC_CATEGORY_ID,
                 maxResults=MAX_SEARCH_RESULTS,
-            ).execute()
+            ).execute(num_retries=MAX_RETRIES, http=self._local_http())
         except HttpError as e:
             self._handle_http_error(e)
 
@@ -108,25 +166,18 @@ class YouTubeClient:
                 status=CacheStatus.NOT_FOUND,
                 matches=[],
                 selected=None,
-                searched_at=datetime.now(),
+                searched_at=searched_at,
                 query_used=query,
             )
 
-        # Get video IDs for duration lookup
-        video_ids = [item["id"]["videoId"] for item in items]
-        durations = self._get_video_durations(video_ids)
-
         matches = []
         for item in items:
-            video_id = item["id"]["videoId"]
             snippet = item["snippet"]
-            duration = durations.get(video_id, "")
-
             matches.append(SearchMatch(
-                video_id=video_id,
+                video_id=item["id"]["videoId"],
                 title=snippet["title"],
                 channel=snippet["channelTitle"],
-                duration=duration,
+                duration="",
             ))
 
         return CacheEntry(
@@ -134,10 +185,39 @@ class YouTubeClient:
             status=CacheStatus.FOUND,
             matches=matches,
             selected=0,
-            searched_at=datetime.now(),
+            searched_at=searched_at,
             query_used=query,
         )
 
+    def fill_durations(self, entries: list[CacheEntry]) -> None:
+        """Back-fill empty match durations across entries in bulk.
+
+        Args:
+            entries: Cache entries whose matches may lack durations;
+                their SearchMatch objects are updated in place.
+
+        Raises:
+            QuotaExceededError: If the API quota has been exceeded.
+            YouTubeAPIError: For other API errors.
+        """
+        video_ids = [
+            match.video_id
+            for entry in entries
+            for match in entry.matches
+            if not match.duration
+        ]
+        if not video_ids:
+            return
+
+        durations = {}
+        for start in range(0, len(video_ids), 50):  # videos.list ID limit
+            durations.update(self._get_video_durations(video_ids[start:start + 50]))
+
+        for entry in entries:
+            for match in entry.matches:
+                if not match.duration:
+                    match.duration = durations.get(match.video_id, "")
+
     def _get_video_durations(self, video_ids: list[str]) -> dict[str, str]:
         """Get video durations for a list of video IDs.
 
@@ -156,18 +236,15 @@ class YouTubeClient:
             response = self.service.videos().list(
                 part="contentDetails",
                 id=",".join(video_ids),
-            ).execute()
+            ).execute(num_retries=MAX_RETRIES, http=self._local_http())
         except HttpError as e:
             self._handle_http_error(e)
             return {}
 
-        durations = {}
-        for item in response.get("items", []):
-            video_id = item["id"]
-            iso_duration = item.get("contentDetails", {}).get("duration", "")
-            durations[video_id] = format_duration(iso_duration)
-
-        return durations
+        return {
+            item["id"]: format_duration(item.get("contentDetails", {}).get("duration", ""))
+            for item in response.get("items", [])
+        }
 
     def create_playlist(
         self,
@@ -203,7 +280,7 @@ class YouTubeClient:
                         "privacyStatus": privacy,
                     },
                 },
-            ).execute()
+            ).execute(num_retries=MAX_RETRIES)
         except HttpError as e:
             self._handle_http_error(e)
 
@@ -249,12 +326,76 @@ class YouTubeClient:
             response = self.service.playlistItems().insert(
                 part="snippet",
                 body=body,
-            ).execute()
+            ).execute(num_retries=MAX_RETRIES)
         except HttpError as e:
             self._handle_http_error(e, video_id=video_id)
 
         return response["id"]
 
+    def add_videos_to_playlist(self, playlist_id: str, video_ids: list[str]) -> list:
+        """Add several videos to a playlist using batched HTTP requests.
+
+        Inserts are multiplexed through BatchHttpRequest in chunks of
+        BATCH_INSERT_SIZE, amortizing the per-call HTTP round-trip.
+        Playlist order follows the order of video_ids.
+
+        Args:
+            playlist_id: The playlist ID.
+            video_ids: The video IDs to add, in playlist order.
+
+        Returns:
+            A list parallel to video_ids: True where the insert succeeded,
+            an exception where it failed, or None if the insert never ran
+            because an earlier chunk exhausted the quota.
+        """
+        results: list = [None] * len(video_ids)
+
+        def on_done(request_id: str, response, exception) -> None:
+            index = int(request_id)
+            if exception is None:
+                results[index] = True
+            elif isinstance(exception, HttpError):
+                try:
+                    self._handle_http_error(exception, video_id=video_ids[index])
+                except PlaylistCreatorError as e:
+                    results[index] = e
+            else:
+                results[index] = YouTubeAPIError(f"YouTube API error: {exception}")
+
+        for start in range(0, len(video_ids), BATCH_INSERT_SIZE):
+            chunk = video_ids[start:start + BATCH_INSERT_SIZE]
+            self._rate_limit()
+
+            batch = self.service.new_batch_http_request(callback=on_done)
+            for offset, video_id in enumerate(chunk):
+                batch.add(
+                    self.service.playlistItems().insert(
+                        part="snippet",
+                        body={
+                            "snippet": {
+                                "playlistId": playlist_id,
+                                "resourceId": {
+                                    "kind": "youtube#video",
+                                    "videoId": video_id,
+                                },
+                            },
+                        },
+                    ),
+                    request_id=str(start + offset),
+                )
+            try:
+                batch.execute()
+            except HttpError as e:
+                # Failure of the batch POST itself, before any per-item
+                # callback fired; translate it like every other call site
+                self._handle_http_error(e)
+
+            # Stop issuing chunks once the quota is gone
+            if any(isinstance(r, QuotaExceededError) for r in results[start:start + len(chunk)]):
+                break
+
+        return results
+
     def get_playlist_items(self, playlist_id: str) -> list[dict]:
         """Get all items in a playlist.
 
@@ -280,17 +421,18 @@ class YouTubeClient:
                     playlistId=playlist_id,
                     maxResults=50,
                     pageToken=page_token,
-                ).execute()
+                ).execute(num_retries=MAX_RETRIES)
             except HttpError as e:
                 self._handle_http_error(e)
 
-            for item in response.get("items", []):
-                snippet = item["snippet"]
-                items.append({
+            items.extend(
+                {
                     "item_id": item["id"],
-                    "video_id": snippet["resourceId"]["videoId"],
-                    "position": snippet["position"],
-                })
+                    "video_id": item["snippet"]["resourceId"]["videoId"],
+                    "position": item["snippet"]["position"],
+                }
+                for item in response.get("items", [])
+            )
 
             page_token = response.get("nextPageToken")
             if not page_token:
@@ -311,7 +453,7 @@ class YouTubeClient:
         self._rate_limit()
 
         try:
-            self.service.playlistItems().delete(id=item_id).execute()
+            self.service.playlistItems().delete(id=item_id).execute(num_retries=MAX_RETRIES)
         except HttpError as e:
             self._handle_http_error(e)
 
@@ -350,6 +492,6 @@ class YouTubeClient:
                         "position": new_position,
                     },
                 },
-            ).execute()
+            ).execute(num_retries=MAX_RETRIES)
         except HttpError as e:
             self._handle_http_error(e)
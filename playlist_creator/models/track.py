@@ -11,29 +11,33 @@ class CacheStatus(Enum):
     NOT_FOUND = "not_found"
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Track:
     """A song from the Markdown file."""
     position: int
     title: str
     artist: str
+    # Normalized query string for searching and cache lookup; computed
+    # once instead of per property access
+    query: str = field(init=False, repr=False, compare=False)
 
-    @property
-    def query(self) -> str:
-        """Normalized query string for searching and cache lookup."""
-        return f"{self.title} - {self.artist}"
+    def __post_init__(self):
+        object.__setattr__(self, "query", f"{self.title} - {self.artist}")
 
 
-@dataclass
+@dataclass(slots=True)
 class SearchMatch:
-    """A YouTube search result."""
+    """A YouTube search result.
+
+    Mutable: durations are back-filled in bulk after the search pass.
+    """
     video_id: str
     title: str
     channel: str
     duration: str
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class CacheEntry:
     """A cached search result."""
     query: str
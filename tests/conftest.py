@@ -0,0 +1,45 @@
+"""Shared fixtures for the test suite."""
+import functools
+
+import pytest
+from click.testing import CliRunner
+
+from playlist_creator.core.parser import parse_markdown_string
+
+
+@functools.lru_cache(maxsize=None)
+def _cached_parse(content: str):
+    return parse_markdown_string(content)
+
+
+@pytest.fixture(scope="session")
+def parse_md():
+    """Memoized parse_markdown_string for tests asserting on its pure output."""
+    return _cached_parse
+
+
+@pytest.fixture(scope="session")
+def runner():
+    """Shared CliRunner; invoke() isolates stdio per call."""
+    return CliRunner()
+
+
+@pytest.fixture(scope="session")
+def md_file_factory(tmp_path_factory):
+    """Return a memoized content -> Path factory for markdown files.
+
+    Identical content written by different tests (or modules) resolves
+    to the same file, so each distinct fixture string hits disk once per
+    session.
+    """
+    cache = {}
+
+    def make(content: str):
+        path = cache.get(content)
+        if path is None:
+            path = tmp_path_factory.mktemp("md") / "playlist.md"
+            path.write_text(content)
+            cache[content] = path
+        return path
+
+    return make
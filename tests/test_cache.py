@@ -18,9 +18,11 @@ class TestCacheManager:
     @pytest.fixture
     def cache_manager(self, temp_cache_dir):
         with patch("playlist_creator.core.cache.CACHE_DIR", temp_cache_dir):
-            with patch("playlist_creator.core.cache.SEARCHES_FILE", temp_cache_dir / "searches.json"):
-                manager = CacheManager()
-                yield manager
+            with patch("playlist_creator.core.cache.SEARCHES_FILE", temp_cache_dir / "searches.jsonl"):
+                with patch("playlist_creator.core.cache.INDEX_FILE", temp_cache_dir / "searches.idx"):
+                    with patch("playlist_creator.core.cache.LEGACY_SEARCHES_FILE", temp_cache_dir / "searches.json"):
+                        manager = CacheManager()
+                        yield manager
 
     def test_init_creates_directories(self, cache_manager, temp_cache_dir):
         cache_manager.ensure_initialized()
@@ -41,19 +43,79 @@ class TestCacheManager:
         assert result.status == CacheStatus.FOUND
         assert result.matches[0].video_id == "abc123"
 
-    def test_persistence(self, temp_cache_dir):
-        with patch("playlist_creator.core.cache.CACHE_DIR", temp_cache_dir):
-            with patch("playlist_creator.core.cache.SEARCHES_FILE", temp_cache_dir / "searches.json"):
-                cache_manager = CacheManager()
-                cache_manager.ensure_initialized()
-                match = SearchMatch("xyz789", "Persisted", "Channel", "2:30")
-                entry = CacheEntry(query="Persist - Test", status=CacheStatus.FOUND, matches=[match], selected=0, searched_at=datetime.now(), query_used='"Persist" "Test"')
-                cache_manager.save(entry)
-                new_manager = CacheManager()
-                result = new_manager.get("Persist - Test")
+    def test_persistence(self, cache_manager):
+        cache_manager.ensure_initialized()
+        match = SearchMatch("xyz789", "Persisted", "Channel", "2:30")
+        entry = CacheEntry(query="Persist - Test", status=CacheStatus.FOUND, matches=[match], selected=0, searched_at=datetime.now(), query_used='"Persist" "Test"')
+        cache_manager.save(entry)
+        new_manager = CacheManager()
+        result = new_manager.get("Persist - Test")
         assert result is not None
         assert result.matches[0].video_id == "xyz789"
 
+    def test_fresh_index_is_reused_without_log_scan(self, cache_manager):
+        match = SearchMatch("abc123", "Indexed", "Channel", "3:45")
+        entry = CacheEntry(query="Indexed - Song", status=CacheStatus.FOUND, matches=[match], selected=0, searched_at=datetime.now(), query_used='"Indexed" "Song"')
+        cache_manager.save(entry)
+
+        with patch.object(CacheManager, "_rebuild_index", side_effect=AssertionError("fresh index must be reused")):
+            new_manager = CacheManager()
+            result = new_manager.get("Indexed - Song")
+
+        assert result is not None
+        assert result.matches[0].video_id == "abc123"
+
+    def test_stale_index_triggers_rebuild(self, cache_manager, temp_cache_dir):
+        match = SearchMatch("abc123", "Indexed", "Channel", "3:45")
+        entry = CacheEntry(query="Indexed - Song", status=CacheStatus.FOUND, matches=[match], selected=0, searched_at=datetime.now(), query_used='"Indexed" "Song"')
+        cache_manager.save(entry)
+
+        # Append a record behind the index's back, so log_size no longer matches
+        record = b'{"query": "Appended - Song", "status": "found", "matches": [["zzz999", "Appended", "Ch", "3:00"]], "selected": 0, "searched_at": 1736541000.0, "query_used": "x"}\n'
+        with open(temp_cache_dir / "searches.jsonl", "ab") as f:
+            f.write(record)
+
+        # Only a rebuild scan can discover the appended entry
+        new_manager = CacheManager()
+        result = new_manager.get("Appended - Song")
+        assert result is not None
+        assert result.matches[0].video_id == "zzz999"
+
+    def test_flush_compacts_superseded_lines(self, cache_manager, temp_cache_dir):
+        # Re-saving one query grows the log with superseded lines; once
+        # they outnumber live entries 2:1 a flush rewrites the log
+        for i in range(5):
+            entry = CacheEntry(query="Test - Artist", status=CacheStatus.FOUND, matches=[], selected=None, searched_at=datetime.now(), query_used=f"attempt {i}")
+            cache_manager.save(entry)
+
+        log_lines = (temp_cache_dir / "searches.jsonl").read_bytes().count(b"\n")
+        assert log_lines == 1
+        # The surviving line is the most recent write
+        new_manager = CacheManager()
+        assert new_manager.get("Test - Artist").query_used == "attempt 4"
+
+    def test_migrates_legacy_json_cache(self, cache_manager, temp_cache_dir):
+        temp_cache_dir.mkdir(parents=True)
+        legacy = {
+            "Yeah! - Usher": {
+                "status": "found",
+                "matches": [{"video_id": "abc123", "title": "Yeah!", "channel": "UsherVEVO", "duration": "4:11"}],
+                "selected": 0,
+                "searched_at": "2025-01-10T20:30:00",
+                "query_used": '"Yeah!" "Usher" official'
+            }
+        }
+        (temp_cache_dir / "searches.json").write_text(json.dumps(legacy))
+
+        result = cache_manager.get("Yeah! - Usher")
+
+        assert result is not None
+        assert result.status == CacheStatus.FOUND
+        assert result.matches[0].video_id == "abc123"
+        assert result.searched_at == datetime(2025, 1, 10, 20, 30)
+        # Imported into the new log, so later loads never reread the legacy file
+        assert (temp_cache_dir / "searches.jsonl").exists()
+
     def test_get_selected_video_id(self, cache_manager):
         cache_manager.ensure_initialized()
         matches = [SearchMatch("first", "First", "Ch1", "3:00"), SearchMatch("second", "Second", "Ch2", "3:01"), SearchMatch("third", "Third", "Ch3", "3:02")]
@@ -1,45 +1,41 @@
 """Tests for create command."""
 import pytest
 from pathlib import Path
-from unittest.mock import Mock, patch, MagicMock
-from click.testing import CliRunner
+from datetime import datetime
+from unittest.mock import Mock, patch
 
 from playlist_creator.commands.create import create_command
 from playlist_creator.models import CacheEntry, CacheStatus, SearchMatch
 
 
-class TestCreateCommand:
-    @pytest.fixture
-    def runner(self):
-        return CliRunner()
+# Shared read-only entry; use dataclasses.replace() if a test needs a variant
+_ENTRY_YEAH = CacheEntry(
+    query="Yeah! - Usher",
+    status=CacheStatus.FOUND,
+    matches=[SearchMatch("abc123", "Yeah!", "UsherVEVO", "4:11")],
+    selected=0,
+    searched_at=datetime(2025, 1, 1),
+    query_used='"Yeah!" "Usher" official'
+)
+
 
-    @pytest.fixture
-    def valid_md_file(self, tmp_path):
-        content = """# Test Playlist
+class TestCreateCommand:
+    @pytest.fixture(scope="module")
+    def valid_md_file(self, md_file_factory):
+        return md_file_factory("""# Test Playlist
 
 | # | Música | Artista |
 |---|--------|---------|
 | 1 | Yeah! | Usher |
-"""
-        file = tmp_path / "test.md"
-        file.write_text(content)
-        return file
+""")
 
     def test_create_success(self, runner, valid_md_file):
         mock_cache = Mock()
-        mock_cache.get.return_value = CacheEntry(
-            query="Yeah! - Usher",
-            status=CacheStatus.FOUND,
-            matches=[SearchMatch("abc123", "Yeah!", "UsherVEVO", "4:11")],
-            selected=0,
-            searched_at=MagicMock(),
-            query_used='"Yeah!" "Usher" official'
-        )
-        mock_cache.get_selected_video_id.return_value = "abc123"
+        mock_cache.snapshot.return_value = {"Yeah! - Usher": (_ENTRY_YEAH, "abc123")}
 
         mock_youtube = Mock()
         mock_youtube.create_playlist.return_value = "PLnewplaylist"
-        mock_youtube.add_video_to_playlist.return_value = "item1"
+        mock_youtube.add_videos_to_playlist.return_value = [True]
 
         with patch("playlist_creator.commands.create.CacheManager", return_value=mock_cache):
             with patch("playlist_creator.commands.create.get_authenticated_service"):
@@ -51,15 +47,7 @@ class TestCreateCommand:
 
     def test_create_dry_run(self, runner, valid_md_file):
         mock_cache = Mock()
-        mock_cache.get.return_value = CacheEntry(
-            query="Yeah! - Usher",
-            status=CacheStatus.FOUND,
-            matches=[SearchMatch("abc123", "Yeah!", "UsherVEVO", "4:11")],
-            selected=0,
-            searched_at=MagicMock(),
-            query_used='"Yeah!" "Usher" official'
-        )
-        mock_cache.get_selected_video_id.return_value = "abc123"
+        mock_cache.snapshot.return_value = {"Yeah! - Usher": (_ENTRY_YEAH, "abc123")}
 
         mock_youtube = Mock()
 
@@ -74,7 +62,7 @@ class TestCreateCommand:
 
     def test_create_missing_cache(self, runner, valid_md_file):
         mock_cache = Mock()
-        mock_cache.get.return_value = None  # Not in cache
+        mock_cache.snapshot.return_value = {}  # Not in cache
 
         with patch("playlist_creator.commands.create.CacheManager", return_value=mock_cache):
             result = runner.invoke(create_command, [str(valid_md_file)])
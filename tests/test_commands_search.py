@@ -1,45 +1,42 @@
 """Tests for search command."""
 import pytest
 from pathlib import Path
-from unittest.mock import Mock, patch, MagicMock
-from click.testing import CliRunner
+from datetime import datetime
+from unittest.mock import Mock, patch
 
 from playlist_creator.commands.search import search_command
 from playlist_creator.models import CacheEntry, CacheStatus, SearchMatch
 
 
-class TestSearchCommand:
-    @pytest.fixture
-    def runner(self):
-        return CliRunner()
+# Shared read-only entry; use dataclasses.replace() if a test needs a variant
+_ENTRY_YEAH = CacheEntry(
+    query="Yeah! - Usher",
+    status=CacheStatus.FOUND,
+    matches=[SearchMatch("abc", "Yeah!", "UsherVEVO", "4:11")],
+    selected=0,
+    searched_at=datetime(2025, 1, 1),
+    query_used='"Yeah!" "Usher" official'
+)
+
 
-    @pytest.fixture
-    def valid_md_file(self, tmp_path):
-        content = """# Test Playlist
+class TestSearchCommand:
+    @pytest.fixture(scope="module")
+    def valid_md_file(self, md_file_factory):
+        return md_file_factory("""# Test Playlist
 
 | # | Música | Artista |
 |---|--------|---------|
 | 1 | Yeah! | Usher |
 | 2 | In Da Club | 50 Cent |
-"""
-        file = tmp_path / "test.md"
-        file.write_text(content)
-        return file
+""")
 
     def test_search_success(self, runner, valid_md_file):
         mock_cache = Mock()
-        mock_cache.has.return_value = False
+        mock_cache.keys.return_value = set()
         mock_cache.get.return_value = None
 
         mock_youtube = Mock()
-        mock_youtube.search.return_value = CacheEntry(
-            query="Yeah! - Usher",
-            status=CacheStatus.FOUND,
-            matches=[SearchMatch("abc", "Yeah!", "UsherVEVO", "4:11")],
-            selected=0,
-            searched_at=MagicMock(),
-            query_used='"Yeah!" "Usher" official'
-        )
+        mock_youtube.search_without_durations.return_value = _ENTRY_YEAH
 
         with patch("playlist_creator.commands.search.CacheManager", return_value=mock_cache):
             with patch("playlist_creator.commands.search.get_authenticated_service"):
@@ -51,25 +48,20 @@ class TestSearchCommand:
 
     def test_search_skips_cached(self, runner, valid_md_file):
         mock_cache = Mock()
-        mock_cache.has.return_value = True  # Already cached
-        mock_cache.get.return_value = CacheEntry(
-            query="Yeah! - Usher",
-            status=CacheStatus.FOUND,
-            matches=[SearchMatch("abc", "Yeah!", "UsherVEVO", "4:11")],
-            selected=0,
-            searched_at=MagicMock(),
-            query_used='"Yeah!" "Usher" official'
-        )
+        mock_cache.keys.return_value = {"Yeah! - Usher", "In Da Club - 50 Cent"}  # Already cached
+        mock_cache.get.return_value = _ENTRY_YEAH
 
         mock_youtube = Mock()
 
         with patch("playlist_creator.commands.search.CacheManager", return_value=mock_cache):
-            with patch("playlist_creator.commands.search.get_authenticated_service"):
+            with patch("playlist_creator.commands.search.get_authenticated_service") as mock_auth:
                 with patch("playlist_creator.commands.search.YouTubeClient", return_value=mock_youtube):
                     result = runner.invoke(search_command, [str(valid_md_file)])
 
-        # YouTube search should not be called for cached items
-        mock_youtube.search.assert_not_called()
+        # YouTube search should not be called for cached items,
+        # and a fully cached run should not even authenticate
+        mock_youtube.search_without_durations.assert_not_called()
+        mock_auth.assert_not_called()
 
     def test_search_file_not_found(self, runner):
         result = runner.invoke(search_command, ["/nonexistent/file.md"])
@@ -1,45 +1,41 @@
 """Tests for sync command."""
 import pytest
 from pathlib import Path
-from unittest.mock import Mock, patch, MagicMock
-from click.testing import CliRunner
+from datetime import datetime
+from unittest.mock import DEFAULT, Mock, patch
 
 from playlist_creator.commands.sync import sync_command
 from playlist_creator.models import CacheEntry, CacheStatus, SearchMatch
 
 
-class TestSyncCommand:
-    @pytest.fixture
-    def runner(self):
-        return CliRunner()
+# Shared read-only entry; use dataclasses.replace() if a test needs a variant
+_ENTRY = CacheEntry(
+    query="test",
+    status=CacheStatus.FOUND,
+    matches=[SearchMatch("vid1", "T", "C", "3:00")],
+    selected=0,
+    searched_at=datetime(2025, 1, 1),
+    query_used="test"
+)
+
 
-    @pytest.fixture
-    def valid_md_file(self, tmp_path):
-        content = """# Test Playlist
+class TestSyncCommand:
+    @pytest.fixture(scope="module")
+    def valid_md_file(self, md_file_factory):
+        return md_file_factory("""# Test Playlist
 
 | # | Música | Artista |
 |---|--------|---------|
 | 1 | Yeah! | Usher |
 | 2 | In Da Club | 50 Cent |
-"""
-        file = tmp_path / "test.md"
-        file.write_text(content)
-        return file
+""")
 
-    def test_sync_dry_run(self, runner, valid_md_file):
+    def test_sync_dry_run(self, runner, valid_md_file, tmp_path):
         mock_cache = Mock()
-        mock_cache.get_selected_video_id.side_effect = lambda q: {
-            "Yeah! - Usher": "vid1",
-            "In Da Club - 50 Cent": "vid2"
-        }.get(q)
-        mock_cache.get.return_value = CacheEntry(
-            query="test",
-            status=CacheStatus.FOUND,
-            matches=[SearchMatch("vid1", "T", "C", "3:00")],
-            selected=0,
-            searched_at=MagicMock(),
-            query_used="test"
-        )
+        mock_cache.snapshot.return_value = {
+            "Yeah! - Usher": (_ENTRY, "vid1"),
+            "In Da Club - 50 Cent": (_ENTRY, "vid2"),
+        }
 
         mock_youtube = Mock()
         mock_youtube.get_playlist_items.return_value = [
@@ -47,17 +43,22 @@ class TestSyncCommand:
             {"item_id": "item2", "video_id": "vid3", "position": 1},  # Not in md
         ]
 
-        with patch("playlist_creator.commands.sync.CacheManager", return_value=mock_cache):
-            with patch("playlist_creator.commands.sync.get_authenticated_service"):
-                with patch("playlist_creator.commands.sync.YouTubeClient", return_value=mock_youtube):
-                    result = runner.invoke(sync_command, [
-                        str(valid_md_file),
-                        "--playlist-id", "PLtest",
-                        "--dry-run"
-                    ])
+        with patch.multiple(
+            "playlist_creator.commands.sync",
+            CacheManager=Mock(return_value=mock_cache),
+            get_authenticated_service=DEFAULT,
+            YouTubeClient=Mock(return_value=mock_youtube),
+        ), patch("playlist_creator.core.cache.PLAYLISTS_DIR", tmp_path / "playlists"):
+            result = runner.invoke(sync_command, [
+                str(valid_md_file),
+                "--playlist-id", "PLtest",
+                "--dry-run"
+            ])
 
         assert result.exit_code == 0
-        assert "ADICIONAR" in result.output or "vid2" in result.output
+        # The one video missing from YouTube must be reported for addition
+        assert "ADICIONAR (1)" in result.output
+        assert "In Da Club" in result.output
 
     def test_sync_requires_playlist_id(self, runner, valid_md_file):
         result = runner.invoke(sync_command, [str(valid_md_file)])
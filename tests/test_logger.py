@@ -1,33 +1,41 @@
 """Tests for logger setup."""
 import pytest
 import logging
-from unittest.mock import patch
-from playlist_creator.core.logger import setup_logging
+from unittest.mock import MagicMock
+from playlist_creator.core.logger import _stop_listener, setup_logging
+
+
+@pytest.fixture(autouse=True)
+def _fake_logs_dir(monkeypatch):
+    """Keep setup_logging away from the real log directory."""
+    fake = MagicMock()
+    fake.mkdir = lambda **kwargs: None
+    fake.__truediv__ = lambda self, x: fake
+    fake.parent = fake
+    monkeypatch.setattr("playlist_creator.core.logger.LOGS_DIR", fake)
+
+
+@pytest.fixture(autouse=True)
+def _reset_logger():
+    """Leave no handlers or listener thread behind for later tests."""
+    yield
+    _stop_listener()
+    logging.getLogger("playlist_creator").handlers.clear()
 
 
 class TestSetupLogging:
     def test_returns_logger(self):
-        with patch("playlist_creator.core.logger.LOGS_DIR") as mock_dir:
-            mock_dir.mkdir = lambda **kwargs: None
-            mock_dir.__truediv__ = lambda self, x: mock_dir
-            mock_dir.parent = mock_dir
-
-            logger = setup_logging(verbose=False)
+        logger = setup_logging(verbose=False)
 
-            assert isinstance(logger, logging.Logger)
-            assert logger.name == "playlist_creator"
+        assert isinstance(logger, logging.Logger)
+        assert logger.name == "playlist_creator"
 
     def test_verbose_sets_debug_level(self):
-        with patch("playlist_creator.core.logger.LOGS_DIR") as mock_dir:
-            mock_dir.mkdir = lambda **kwargs: None
-            mock_dir.__truediv__ = lambda self, x: mock_dir
-            mock_dir.parent = mock_dir
-
-            logger = setup_logging(verbose=True)
-
-            has_debug_handler = any(
-                h.level == logging.DEBUG
-                for h in logger.handlers
-                if isinstance(h, logging.StreamHandler)
-            )
-            assert has_debug_handler
+        logger = setup_logging(verbose=True)
+
+        has_debug_handler = any(
+            h.level == logging.DEBUG
+            for h in logger.handlers
+            if isinstance(h, logging.StreamHandler)
+        )
+        assert has_debug_handler
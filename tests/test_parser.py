@@ -1,7 +1,7 @@
 """Tests for Markdown parser."""
 import pytest
 from pathlib import Path
-from playlist_creator.core.parser import parse_markdown, parse_markdown_string
+from playlist_creator.core.parser import parse_markdown, parse_markdown_stream
 from playlist_creator.core.exceptions import ParseError
 from playlist_creator.models import Track
 
@@ -9,9 +9,15 @@ from playlist_creator.models import Track
 FIXTURES_DIR = Path(__file__).parent / "fixtures"
 
 
+# Parsed once per session; tests only read the result
+@pytest.fixture(scope="session")
+def parsed_valid_playlist():
+    return parse_markdown(FIXTURES_DIR / "valid_playlist.md")
+
+
 class TestParseMarkdown:
-    def test_parse_valid_playlist(self):
-        result = parse_markdown(FIXTURES_DIR / "valid_playlist.md")
+    def test_parse_valid_playlist(self, parsed_valid_playlist):
+        result = parsed_valid_playlist
 
         assert result.name == "2000s R&B & Hip-Hop Classics"
         assert len(result.tracks) == 3
@@ -30,20 +36,35 @@ class TestParseMarkdown:
             parse_markdown(Path("/nonexistent/file.md"))
 
 
+class TestParseMarkdownStream:
+    def test_streams_tracks_lazily(self):
+        name, tracks = parse_markdown_stream(FIXTURES_DIR / "valid_playlist.md")
+
+        assert name == "2000s R&B & Hip-Hop Classics"
+        assert next(tracks) == Track(1, "Yeah!", "Usher ft. Lil Jon & Ludacris")
+        assert len(list(tracks)) == 2
+
+    def test_stream_no_title(self, tmp_path):
+        file = tmp_path / "no_title.md"
+        file.write_text("| # | Música | Artista |\n|---|---|---|\n| 1 | Song | Artist |\n")
+        with pytest.raises(ParseError):
+            parse_markdown_stream(file)
+
+
 class TestParseMarkdownString:
-    def test_parse_simple_string(self):
+    def test_parse_simple_string(self, parse_md):
         content = """# Test Playlist
 
 | # | Música | Artista |
 |---|--------|---------|
 | 1 | Bohemian Rhapsody | Queen |
 """
-        result = parse_markdown_string(content)
+        result = parse_md(content)
         assert result.name == "Test Playlist"
         assert len(result.tracks) == 1
         assert result.tracks[0].title == "Bohemian Rhapsody"
 
-    def test_parse_multiple_tables(self):
+    def test_parse_multiple_tables(self, parse_md):
         content = """# Multi-Table Playlist
 
 First section:
@@ -59,26 +80,26 @@ Second section:
 |---|--------|---------|
 | 3 | Song C | Artist C |
 """
-        result = parse_markdown_string(content)
+        result = parse_md(content)
         assert len(result.tracks) == 3
         assert result.tracks[2].position == 3
 
-    def test_parse_no_title(self):
+    def test_parse_no_title(self, parse_md):
         content = """| # | Música | Artista |
 |---|--------|---------|
 | 1 | Song | Artist |
 """
         with pytest.raises(ParseError) as exc_info:
-            parse_markdown_string(content)
+            parse_md(content)
         assert "title" in str(exc_info.value).lower() or "H1" in str(exc_info.value)
 
-    def test_strips_whitespace(self):
+    def test_strips_whitespace(self, parse_md):
         content = """# Test
 
 | # | Música | Artista |
 |---|--------|---------|
 | 1 |   Spaced Song   |   Spaced Artist   |
 """
-        result = parse_markdown_string(content)
+        result = parse_md(content)
         assert result.tracks[0].title == "Spaced Song"
         assert result.tracks[0].artist == "Spaced Artist"
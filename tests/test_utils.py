@@ -12,29 +12,27 @@ from playlist_creator.core.exceptions import YouTubeAPIError
 
 
 class TestBuildSearchQuery:
-    def test_simple_query(self):
-        query = build_search_query("Yeah!", "Usher")
-        assert '"Yeah!"' in query
-        assert '"Usher"' in query
+    @pytest.mark.parametrize("title,artist", [
+        ("Yeah!", "Usher"),
+        ("Yeah!", "Usher ft. Lil Jon & Ludacris"),
+    ])
+    def test_quotes_title_and_artist(self, title, artist):
+        query = build_search_query(title, artist)
+        assert f'"{title}"' in query
+        assert f'"{artist}"' in query
         assert "official" in query.lower()
 
-    def test_query_with_featuring(self):
-        query = build_search_query("Yeah!", "Usher ft. Lil Jon & Ludacris")
-        assert '"Yeah!"' in query
-        assert '"Usher ft. Lil Jon & Ludacris"' in query
-
 
 class TestFormatDuration:
-    def test_format_iso_duration(self):
-        assert format_duration("PT3M45S") == "3:45"
-        assert format_duration("PT4M11S") == "4:11"
-        assert format_duration("PT1H2M30S") == "1:02:30"
-
-    def test_format_seconds_only(self):
-        assert format_duration("PT45S") == "0:45"
-
-    def test_format_already_formatted(self):
-        assert format_duration("3:45") == "3:45"
+    @pytest.mark.parametrize("duration,expected", [
+        ("PT3M45S", "3:45"),
+        ("PT4M11S", "4:11"),
+        ("PT1H2M30S", "1:02:30"),
+        ("PT45S", "0:45"),
+        ("3:45", "3:45"),  # already formatted: passes through
+    ])
+    def test_format_duration(self, duration, expected):
+        assert format_duration(duration) == expected
 
 
 class TestRetryWithBackoff:
@@ -45,6 +43,10 @@ class TestRetryWithBackoff:
         assert result == "success"
         assert mock_func.call_count == 1
 
+    @pytest.fixture(autouse=True)
+    def _no_sleep(self, monkeypatch):
+        monkeypatch.setattr("playlist_creator.core.utils.time.sleep", lambda *_: None)
+
     def test_retry_then_success(self):
         mock_func = Mock(side_effect=[YouTubeAPIError("fail"), "success"])
         decorated = retry_with_backoff(max_retries=3, base_delay=0.01)(mock_func)
@@ -61,8 +63,11 @@ class TestRetryWithBackoff:
 
 
 class TestIcons:
-    def test_icons_exist(self):
-        assert Icons.SUCCESS == "✓"
-        assert Icons.WARNING == "⚠"
-        assert Icons.ERROR == "❌"
-        assert Icons.SEARCH == "🔍"
+    @pytest.mark.parametrize("name,expected", [
+        ("SUCCESS", "✓"),
+        ("WARNING", "⚠"),
+        ("ERROR", "❌"),
+        ("SEARCH", "🔍"),
+    ])
+    def test_icons_exist(self, name, expected):
+        assert getattr(Icons, name) == expected
@@ -1,30 +1,58 @@
 """Tests for YouTube API client."""
+import functools
+
 import pytest
+from types import SimpleNamespace
 from unittest.mock import Mock, patch, MagicMock
 from datetime import datetime
 
+from googleapiclient.errors import HttpError
+
 from playlist_creator.core.youtube_client import YouTubeClient
 from playlist_creator.models import SearchMatch, CacheEntry, CacheStatus
 from playlist_creator.core.exceptions import QuotaExceededError, YouTubeAPIError, VideoUnavailableError
 
 
-class TestYouTubeClientSearch:
-    @pytest.fixture
-    def mock_service(self):
-        return Mock()
+@functools.lru_cache(maxsize=None)
+def _http_error(status: int, reason: str) -> HttpError:
+    """Build (and memoize) an HttpError with the given API error reason."""
+    return HttpError(
+        resp=SimpleNamespace(status=status, reason=""),
+        content=f'{{"error": {{"errors": [{{"reason": "{reason}"}}]}}}}'.encode(),
+    )
+
+
+# One service mock and client shared by the whole module; per-test state
+# is wiped by the autouse reset below, so tests stay independent without
+# paying Mock construction for each one
+@pytest.fixture(scope="module")
+def mock_service():
+    return Mock()
+
+
+@pytest.fixture(scope="module")
+def client(mock_service):
+    return YouTubeClient(service=mock_service)
+
+
+@pytest.fixture(autouse=True)
+def _reset_client(mock_service, client, monkeypatch):
+    # No real rate-limit waits against a mocked service
+    monkeypatch.setattr("playlist_creator.core.youtube_client.time.sleep", lambda *_: None)
+    yield
+    mock_service.reset_mock(return_value=True, side_effect=True)
+    client._next_allowed = 0.0  # don't carry rate-limit waits across tests
 
-    @pytest.fixture
-    def client(self, mock_service):
-        return YouTubeClient(service=mock_service)
 
+class TestYouTubeClientSearch:
     def test_search_returns_matches(self, client, mock_service):
-        mock_service.search().list().execute.return_value = {
+        mock_service.search.return_value.list.return_value.execute.return_value = {
             "items": [
                 {"id": {"videoId": "abc123"}, "snippet": {"title": "Yeah! (Official Video)", "channelTitle": "UsherVEVO"}},
                 {"id": {"videoId": "def456"}, "snippet": {"title": "Yeah! Lyrics", "channelTitle": "LyricsChannel"}}
             ]
         }
-        mock_service.videos().list().execute.return_value = {
+        mock_service.videos.return_value.list.return_value.execute.return_value = {
             "items": [
                 {"id": "abc123", "contentDetails": {"duration": "PT4M11S"}},
                 {"id": "def456", "contentDetails": {"duration": "PT4M10S"}}
@@ -37,53 +65,107 @@ class TestYouTubeClientSearch:
         assert result.matches[0].duration == "4:11"
 
     def test_search_no_results(self, client, mock_service):
-        mock_service.search().list().execute.return_value = {"items": []}
+        mock_service.search.return_value.list.return_value.execute.return_value = {"items": []}
         result = client.search("Unknown Song", "Unknown Artist")
         assert result.status == CacheStatus.NOT_FOUND
         assert result.matches == []
 
     def test_search_quota_exceeded(self, client, mock_service):
-        from googleapiclient.errors import HttpError
-        error_response = Mock()
-        error_response.status = 403
-        mock_service.search().list().execute.side_effect = HttpError(
-            resp=error_response, content=b'{"error": {"errors": [{"reason": "quotaExceeded"}]}}'
-        )
+        mock_service.search.return_value.list.return_value.execute.side_effect = _http_error(403, "quotaExceeded")
         with pytest.raises(QuotaExceededError):
             client.search("Test", "Artist")
 
 
-class TestYouTubeClientPlaylist:
-    @pytest.fixture
-    def mock_service(self):
-        return Mock()
+class _FakeBatch:
+    """Stand-in for BatchHttpRequest: runs the callback per added request.
+
+    errors maps request_id -> exception passed to the callback;
+    fail_with, if set, is raised from execute() itself (endpoint failure
+    before any callback fires).
+    """
+
+    def __init__(self, callback, errors=None, fail_with=None):
+        self._callback = callback
+        self._request_ids = []
+        self._errors = errors or {}
+        self._fail_with = fail_with
+
+    def add(self, request, request_id=None):
+        self._request_ids.append(request_id)
+
+    def execute(self):
+        if self._fail_with is not None:
+            raise self._fail_with
+        for request_id in self._request_ids:
+            exception = self._errors.get(request_id)
+            response = None if exception else {"id": f"item-{request_id}"}
+            self._callback(request_id, response, exception)
+
 
-    @pytest.fixture
-    def client(self, mock_service):
-        return YouTubeClient(service=mock_service)
+class TestYouTubeClientBatchAdd:
+    def test_batch_add_all_succeed(self, client, mock_service):
+        mock_service.new_batch_http_request.side_effect = _FakeBatch
 
+        results = client.add_videos_to_playlist("PLtest", ["vid1", "vid2", "vid3"])
+
+        assert results == [True, True, True]
+
+    def test_batch_add_translates_unavailable_video(self, client, mock_service):
+        errors = {"1": _http_error(404, "videoNotFound")}
+        mock_service.new_batch_http_request.side_effect = (
+            lambda callback: _FakeBatch(callback, errors=errors)
+        )
+
+        results = client.add_videos_to_playlist("PLtest", ["vid1", "deleted", "vid3"])
+
+        assert results[0] is True
+        assert isinstance(results[1], VideoUnavailableError)
+        assert results[1].video_id == "deleted"
+        assert results[2] is True
+
+    def test_batch_add_quota_stops_later_chunks(self, client, mock_service, monkeypatch):
+        monkeypatch.setattr("playlist_creator.core.youtube_client.BATCH_INSERT_SIZE", 2)
+        errors = {"1": _http_error(403, "quotaExceeded")}
+        mock_service.new_batch_http_request.side_effect = (
+            lambda callback: _FakeBatch(callback, errors=errors)
+        )
+
+        results = client.add_videos_to_playlist("PLtest", ["vid1", "vid2", "vid3", "vid4"])
+
+        # Quota dies mid-chunk: later inserts stay None and no new batch is issued
+        assert results[0] is True
+        assert isinstance(results[1], QuotaExceededError)
+        assert results[2] is None
+        assert results[3] is None
+        assert mock_service.new_batch_http_request.call_count == 1
+
+    def test_batch_add_endpoint_failure(self, client, mock_service):
+        mock_service.new_batch_http_request.side_effect = (
+            lambda callback: _FakeBatch(callback, fail_with=_http_error(403, "quotaExceeded"))
+        )
+
+        with pytest.raises(QuotaExceededError):
+            client.add_videos_to_playlist("PLtest", ["vid1"])
+
+
+class TestYouTubeClientPlaylist:
     def test_create_playlist(self, client, mock_service):
-        mock_service.playlists().insert().execute.return_value = {"id": "PLnewplaylist123", "snippet": {"title": "Test"}}
+        mock_service.playlists.return_value.insert.return_value.execute.return_value = {"id": "PLnewplaylist123", "snippet": {"title": "Test"}}
         result = client.create_playlist("Test Playlist", privacy="private")
         assert result == "PLnewplaylist123"
 
     def test_add_video_to_playlist(self, client, mock_service):
-        mock_service.playlistItems().insert().execute.return_value = {"id": "item123"}
+        mock_service.playlistItems.return_value.insert.return_value.execute.return_value = {"id": "item123"}
         result = client.add_video_to_playlist("PLtest", "videoABC")
         assert result == "item123"
 
     def test_add_video_unavailable(self, client, mock_service):
-        from googleapiclient.errors import HttpError
-        error_response = Mock()
-        error_response.status = 404
-        mock_service.playlistItems().insert().execute.side_effect = HttpError(
-            resp=error_response, content=b'{"error": {"errors": [{"reason": "videoNotFound"}]}}'
-        )
+        mock_service.playlistItems.return_value.insert.return_value.execute.side_effect = _http_error(404, "videoNotFound")
         with pytest.raises(VideoUnavailableError):
             client.add_video_to_playlist("PLtest", "deletedVideo")
 
     def test_get_playlist_items(self, client, mock_service):
-        mock_service.playlistItems().list().execute.return_value = {
+        mock_service.playlistItems.return_value.list.return_value.execute.return_value = {
             "items": [
                 {"id": "item1", "snippet": {"resourceId": {"videoId": "vid1"}, "position": 0}},
                 {"id": "item2", "snippet": {"resourceId": {"videoId": "vid2"}, "position": 1}}
@@ -95,6 +177,6 @@ class TestYouTubeClientPlaylist:
         assert result[0]["video_id"] == "vid1"
 
     def test_remove_playlist_item(self, client, mock_service):
-        mock_service.playlistItems().delete().execute.return_value = {}
+        mock_service.playlistItems.return_value.delete.return_value.execute.return_value = {}
         client.remove_playlist_item("item123")
-        mock_service.playlistItems().delete.assert_called_with(id="item123")
+        mock_service.playlistItems.return_value.delete.assert_called_with(id="item123")